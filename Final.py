@@ -1,92 +1,66 @@
-import json
 import random
 import streamlit as st
 from quiz_helper import load_questions, get_random_questions
-from helper import (
-    show_recursion,
-    show_asymptotic,
-    show_arrays,
-    show_linked_lists,
-    show_stack_queue,
-    show_heap,
-    show_hash_tables_trees,
-    show_sorting,
-    show_searching,
-    show_graphs,
-)
+
+# Topic label -> function in helper.py. Only the selected topic is rendered by default.
+TOPICS = {
+    "1. Recursion": "show_recursion",
+    "2. Asymptotic Analysis": "show_asymptotic",
+    "3. Arrays": "show_arrays",
+    "4. Linked Lists": "show_linked_lists",
+    "5. Stack & Queue": "show_stack_queue",
+    "6. Heap": "show_heap",
+    "7. Hash Tables & Trees": "show_hash_tables_trees",
+    "8. Sorting": "show_sorting",
+    "9. Searching": "show_searching",
+    "10. Graphs & Traversals": "show_graphs",
+}
+
+
+def show_topic(topic, language):
+    import helper
+    getattr(helper, TOPICS[topic])(language)
+
+
+# Parsed once per server process and shared by all sessions; every call hands back
+# a fresh copy, so shuffling it in place is safe
+load_quiz = st.cache_data(load_questions)
+
 
 # Set up Streamlit page configuration
 st.set_page_config(page_title="ADS Helper", layout="wide")
 
-# Create three main tabs for the app
-tab1, tab2, tab3 = st.tabs(["📚 Conspects", "📝 Past Quizzes", "🎮 Take a Quiz"])
+# Three main sections. Unlike st.tabs, which runs every tab's code on every rerun,
+# only the selected section is built
+page = st.radio("Section", ["📚 Conspects", "📝 Past Quizzes", "🎮 Take a Quiz"],
+                horizontal=True, label_visibility="collapsed")
 
 # ----------------- TAB 1: Conspects (Notes & Code Samples) -----------------
-with tab1:
+if page == "📚 Conspects":
     st.title("📚 ADS Conspects")
 
     # Sidebar for topic and language selection
     st.sidebar.title("🧭 Navigation")
-    topic = st.sidebar.radio("📘 Choose Topic", [
-        "Show Everything",
-        "1. Recursion",
-        "2. Asymptotic Analysis",
-        "3. Arrays",
-        "4. Linked Lists",
-        "5. Stack & Queue",
-        "6. Heap",
-        "7. Hash Tables & Trees",
-        "8. Sorting",
-        "9. Searching",
-        "10. Graphs & Traversals",
-    ])
+    topic = st.sidebar.radio("📘 Choose Topic", ["Show Everything", *TOPICS], index=1)
 
     language = st.sidebar.selectbox("💻 Code Language", ["Python", "C++", "Java"])
 
     # Show selected topic(s) in the chosen language
     if topic == "Show Everything":
-        show_recursion(language)
-        show_asymptotic(language)
-        show_arrays(language)
-        show_linked_lists(language)
-        show_stack_queue(language)
-        show_heap(language)
-        show_hash_tables_trees(language)
-        show_sorting(language)
-        show_searching(language)
-        show_graphs(language)
-    elif topic == "1. Recursion":
-        show_recursion(language)
-    elif topic == "2. Asymptotic Analysis":
-        show_asymptotic(language)
-    elif topic == "3. Arrays":
-        show_arrays(language)
-    elif topic == "4. Linked Lists":
-        show_linked_lists(language)
-    elif topic == "5. Stack & Queue":
-        show_stack_queue(language)
-    elif topic == "6. Heap":
-        show_heap(language)
-    elif topic == "7. Hash Tables & Trees":
-        show_hash_tables_trees(language)
-    elif topic == "8. Sorting":
-        show_sorting(language)
-    elif topic == "9. Searching":
-        show_searching(language)
-    elif topic == "10. Graphs & Traversals":
-        show_graphs(language)
+        for name in TOPICS:
+            show_topic(name, language)
+    else:
+        show_topic(topic, language)
 
 # ----------------- TAB 2: Past Quizzes -----------------
-with tab2:
+elif page == "📝 Past Quizzes":
     st.title("📝 Past Quizzes")
 
     # Hide sidebar for cleaner look in this tab
 
     # Load quiz questions from JSON files
-    with open("mid.json") as f:
-        mid_data = json.load(f)
-    with open("end.json") as f:
-        end_data = json.load(f)
+    mid_data = load_quiz("Midterm")
+    end_data = load_quiz("Final")
 
     # Choose which quiz to display
     section = st.radio("📂 Select Quiz", ["Midterm Questions", "Final Questions"], horizontal=True)
@@ -107,29 +81,37 @@ with tab2:
         st.markdown("---")
 
 # ----------------- TAB 3: Take a Quiz -----------------
-with tab3:
+else:
 
     # Load quiz questions from JSON files
-    with open("mid.json") as f:
-        mid_questions = json.load(f)
-    with open("end.json") as f:
-        end_questions = json.load(f)
+    mid_questions = load_quiz("Midterm")
+    end_questions = load_quiz("Final")
 
     st.title("🎮 Take a Quiz")
     
     # Reset all session state if requested
     if st.button("🔄 Try Again (Reset All)"):
-        for key in ["submitted", "quiz_answers", "quiz", "shuffled_questions", "num_questions_prev"]:
+        for key in ["submitted", "quiz_answers", "quiz", "shuffled_questions", "num_questions_prev",
+                    "saved_quiz_source", "saved_quiz_num_questions"]:
             if key in st.session_state:
                 del st.session_state[key]
         st.rerun()
 
-    # Select quiz source and number of questions
+    # Select quiz source and number of questions. Streamlit forgets the value of a
+    # widget that is not drawn in a run, so while another section is open these would
+    # fall back to their defaults and a new quiz would be drawn. The choices are copied
+    # to plain session_state keys and put back before the widgets are created.
+    for key in ["quiz_source", "quiz_num_questions"]:
+        if key not in st.session_state and "saved_" + key in st.session_state:
+            st.session_state[key] = st.session_state["saved_" + key]
     col1, col2 = st.columns(2)
     with col1:
-        source = st.selectbox("📚 Question Source", ["Midterm", "Final", "Both"])
+        source = st.selectbox("📚 Question Source", ["Midterm", "Final", "Both"], key="quiz_source")
     with col2:
-        num_questions = st.selectbox("🔢 Number of Questions", [5, 10, 15, 20, 25, 30, 35, 40])
+        num_questions = st.selectbox("🔢 Number of Questions", [5, 10, 15, 20, 25, 30, 35, 40],
+                                     key="quiz_num_questions")
+    st.session_state.saved_quiz_source = source
+    st.session_state.saved_quiz_num_questions = num_questions
 
     # Reset quiz state if number of questions changes
     if "num_questions_prev" not in st.session_state or st.session_state.num_questions_prev != num_questions:
@@ -0,0 +1,308 @@
+import argparse
+import multiprocessing
+import random
+import sys
+import threading
+import time
+from functools import lru_cache
+
+# Dynamic programming three ways for each problem:
+#   *_memo     - top-down recursion with an lru_cache (maxsize=None is unbounded)
+#   *_table    - bottom-up with the full table, O(n) for fib and O(n·m) for the 2D problems
+#   *_rolling  - bottom-up keeping only the rows still needed, O(1) / O(m)
+
+MOD = 1_000_000_007
+
+
+# ----------------- Fibonacci -----------------
+
+def fib_memo(n, maxsize=None, mod=None):
+    # fib(k) calls fib(k-1) first, so by the time fib(k-2) is asked for it was just
+    # computed: an LRU of 3 entries is enough, maxsize=None keeps all n of them
+    @lru_cache(maxsize=maxsize)
+    def fib(k):
+        if k <= 1:
+            return k
+        v = fib(k - 1) + fib(k - 2)
+        return v % mod if mod else v
+    return fib(n)
+
+
+def fib_table(n, mod=None):
+    table = [0] * (n + 1)
+    if n > 0:
+        table[1] = 1
+    for k in range(2, n + 1):
+        v = table[k - 1] + table[k - 2]
+        table[k] = v % mod if mod else v
+    return table[n]
+
+
+def fib_rolling(n, mod=None):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, (a + b) % mod if mod else a + b
+    return a
+
+
+# ----------------- Longest Common Subsequence -----------------
+
+def lcs_memo(a, b, maxsize=None):
+    @lru_cache(maxsize=maxsize)
+    def lcs(i, j):
+        if i == len(a) or j == len(b):
+            return 0
+        if a[i] == b[j]:
+            return 1 + lcs(i + 1, j + 1)
+        return max(lcs(i + 1, j), lcs(i, j + 1))
+    return lcs(0, 0)
+
+
+def lcs_table(a, b):
+    table = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                table[i][j] = table[i - 1][j - 1] + 1
+            else:
+                table[i][j] = max(table[i - 1][j], table[i][j - 1])
+    return table[len(a)][len(b)]
+
+
+def lcs_rolling(a, b):
+    # Row i only reads row i-1, so two rows of len(b)+1 are enough
+    prev = [0] * (len(b) + 1)
+    for i in range(1, len(a) + 1):
+        cur = [0] * (len(b) + 1)
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                cur[j] = prev[j - 1] + 1
+            else:
+                cur[j] = max(prev[j], cur[j - 1])
+        prev = cur
+    return prev[len(b)]
+
+
+# ----------------- 0/1 Knapsack -----------------
+
+def knapsack_memo(weights, values, capacity, maxsize=None):
+    @lru_cache(maxsize=maxsize)
+    def best(i, cap):
+        if i == len(weights):
+            return 0
+        skip = best(i + 1, cap)
+        if weights[i] > cap:
+            return skip
+        return max(skip, values[i] + best(i + 1, cap - weights[i]))
+    return best(0, capacity)
+
+
+def knapsack_table(weights, values, capacity):
+    table = [[0] * (capacity + 1) for _ in range(len(weights) + 1)]
+    for i in range(1, len(weights) + 1):
+        w, v = weights[i - 1], values[i - 1]
+        for cap in range(capacity + 1):
+            table[i][cap] = table[i - 1][cap]
+            if w <= cap and table[i - 1][cap - w] + v > table[i][cap]:
+                table[i][cap] = table[i - 1][cap - w] + v
+    return table[len(weights)][capacity]
+
+
+def knapsack_rolling(weights, values, capacity):
+    # One row, filled right to left so each item is still used at most once
+    row = [0] * (capacity + 1)
+    for w, v in zip(weights, values):
+        for cap in range(capacity, w - 1, -1):
+            if row[cap - w] + v > row[cap]:
+                row[cap] = row[cap - w] + v
+    return row[capacity]
+
+
+# ----------------- Edit Distance -----------------
+
+def edit_distance_memo(a, b, maxsize=None):
+    @lru_cache(maxsize=maxsize)
+    def dist(i, j):
+        if i == len(a):
+            return len(b) - j
+        if j == len(b):
+            return len(a) - i
+        if a[i] == b[j]:
+            return dist(i + 1, j + 1)
+        return 1 + min(dist(i + 1, j), dist(i, j + 1), dist(i + 1, j + 1))
+    return dist(0, 0)
+
+
+def edit_distance_table(a, b):
+    table = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        table[i][0] = i
+    for j in range(len(b) + 1):
+        table[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                table[i][j] = table[i - 1][j - 1]
+            else:
+                table[i][j] = 1 + min(table[i - 1][j], table[i][j - 1], table[i - 1][j - 1])
+    return table[len(a)][len(b)]
+
+
+def edit_distance_rolling(a, b):
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                cur[j] = prev[j - 1]
+            else:
+                cur[j] = 1 + min(prev[j], cur[j - 1], prev[j - 1])
+        prev = cur
+    return prev[len(b)]
+
+
+# ----------------- Benchmark -----------------
+
+def run_deep(func, *args):
+    # Top-down recursion goes n levels deep (n+m for the 2D problems), far past the
+    # default limit, so it runs in a thread with a big stack and a raised limit
+    result = {}
+
+    def target():
+        try:
+            result["value"] = func(*args)
+        except BaseException as e:
+            result["error"] = e
+
+    old_limit = sys.getrecursionlimit()
+    old_stack = threading.stack_size(512 * 1024 * 1024)
+    sys.setrecursionlimit(10**7)
+    try:
+        t = threading.Thread(target=target)
+        t.start()
+        t.join()
+    finally:
+        threading.stack_size(old_stack)
+        sys.setrecursionlimit(old_limit)
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def _status_kb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1])
+    return 0
+
+
+def _measure_child(conn, func, args):
+    # Reset the peak-RSS watermark (Linux), so VmHWM afterwards is this run's peak.
+    # tracemalloc is not used: it slows down to minutes on 10^4+ deep recursion,
+    # and RSS also counts the call stack that top-down memoization needs.
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        before = _status_kb("VmRSS:")
+        start = time.perf_counter()
+        value = run_deep(func, *args)
+        elapsed = time.perf_counter() - start
+        conn.send(("ok", value, elapsed, (_status_kb("VmHWM:") - before) * 1024))
+    except BaseException as e:
+        # MemoryError, RecursionError, ... go back to the parent as a failed row
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def measure(func, *args):
+    # Each run gets its own forked process so caches and freed memory from
+    # earlier runs do not blur the peak.
+    # Returns (value, elapsed, peak), or (None, None, reason) if the run failed.
+    ctx = multiprocessing.get_context("fork")
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_measure_child, args=(send, func, args))
+    proc.start()
+    # Only the child holds the write end now, so recv() sees EOF if it dies
+    send.close()
+    try:
+        result = recv.recv()
+    except EOFError:
+        result = None
+    finally:
+        recv.close()
+    proc.join()
+
+    if result is None:
+        if proc.exitcode is not None and proc.exitcode < 0:
+            return None, None, f"killed by signal {-proc.exitcode} (OOM?)"
+        return None, None, f"exited with code {proc.exitcode} without a result"
+    if result[0] == "error":
+        return None, None, result[1]
+    return result[1:]
+
+
+def problems(n, lru_size, rng):
+    # (strategy, func, args) for every problem at size n
+    a = "".join(rng.choice("ACGT") for _ in range(n))
+    b = "".join(rng.choice("ACGT") for _ in range(n))
+    weights = [rng.randint(1, n) for _ in range(n)]
+    values = [rng.randint(1, 100) for _ in range(n)]
+    return {
+        # Mod keeps every cell a small int, so memory shows the table shape rather than bigint growth
+        "fib": [
+            ("memo", fib_memo, (n, None, MOD)),
+            (f"memo-lru{lru_size}", fib_memo, (n, lru_size, MOD)),
+            ("table", fib_table, (n, MOD)),
+            ("rolling", fib_rolling, (n, MOD)),
+        ],
+        "lcs": [
+            ("memo", lcs_memo, (a, b)),
+            ("table", lcs_table, (a, b)),
+            ("rolling", lcs_rolling, (a, b)),
+        ],
+        "knapsack": [
+            ("memo", knapsack_memo, (tuple(weights), tuple(values), n)),
+            ("table", knapsack_table, (weights, values, n)),
+            ("rolling", knapsack_rolling, (weights, values, n)),
+        ],
+        "edit": [
+            ("memo", edit_distance_memo, (a, b)),
+            ("table", edit_distance_table, (a, b)),
+            ("rolling", edit_distance_rolling, (a, b)),
+        ],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time and peak memory of memoization vs. tabulation vs. rolling rows")
+    parser.add_argument("--fib-sizes", type=int, nargs="+", default=[10**4, 5 * 10**4, 10**5])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000],
+                        help="string length / item count for LCS, knapsack and edit distance")
+    parser.add_argument("--memo-limit", type=int, default=1000,
+                        help="skip top-down memo on 2D problems above this size (n² cached calls)")
+    parser.add_argument("--lru-size", type=int, default=3, help="cache bound for the bounded fib memo")
+    parser.add_argument("--problems", nargs="+", default=["fib", "lcs", "knapsack", "edit"])
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    print(f"{'problem':9} {'n':>7} {'strategy':12} {'time (s)':>10} {'peak memory':>14}")
+    for name in args.problems:
+        for n in args.fib_sizes if name == "fib" else args.sizes:
+            answers = set()
+            for strategy, func, fargs in problems(n, args.lru_size, rng)[name]:
+                if name != "fib" and strategy == "memo" and n > args.memo_limit:
+                    continue
+                value, elapsed, peak = measure(func, *fargs)
+                if elapsed is None:
+                    print(f"{name:9} {n:>7} {strategy:12} {'failed':>10}  {peak}")
+                    continue
+                answers.add(value)
+                print(f"{name:9} {n:>7} {strategy:12} {elapsed:10.3f} {peak / 2**20:11.2f} MB")
+            if len(answers) > 1:
+                print(f"  !! strategies disagree for {name} n={n}: {answers}")
+
+
+if __name__ == "__main__":
+    main()
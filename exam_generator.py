@@ -0,0 +1,240 @@
+import argparse
+import html
+import json
+import os
+import random
+import resource
+import sys
+import time
+from collections import Counter, deque
+from multiprocessing import Pool
+
+from quiz_helper import load_questions
+
+# Questions are shared with the worker processes once, through the pool initializer
+_bank = None
+
+
+def _init_worker(bank):
+    global _bank
+    _bank = bank
+
+
+def select_variants(bank_size, variants, count, max_overlap, seed):
+    # Picks the question indices of every variant up front, in the main process, since
+    # each pick depends on the ones before it. Questions are taken least-recently-used
+    # first, so the whole bank is covered before any question repeats, and a question
+    # is skipped when taking it would make this variant share more than `max_overlap`
+    # questions with an earlier one. Raises ValueError when a variant can't be filled.
+    if max_overlap >= count:
+        raise ValueError(f"--max-overlap must be below {count}, otherwise variants may repeat")
+
+    rng = random.Random(seed)
+    order = list(range(bank_size))
+    rng.shuffle(order)
+    queue = deque(order)
+    since_shuffle = 0
+    used_in = [[] for _ in range(bank_size)]  # question -> variants it appears in
+    selections = []
+
+    for v in range(variants):
+        overlap = Counter()
+        picked, skipped = [], []
+        while len(picked) < count and queue:
+            q = queue.popleft()
+            if any(overlap[w] >= max_overlap for w in used_in[q]):
+                skipped.append(q)
+                continue
+            for w in used_in[q]:
+                overlap[w] += 1
+            picked.append(q)
+
+        if len(picked) < count:
+            raise ValueError(
+                f"Only {v} variants of {count} questions fit in a bank of {bank_size} "
+                f"with at most {max_overlap} shared questions; use fewer variants or a higher --max-overlap"
+            )
+        # Skipped questions stay first in line, the picked ones go to the back
+        queue.extendleft(reversed(skipped))
+        queue.extend(picked)
+        for q in picked:
+            used_in[q].append(v)
+        selections.append(picked)
+
+        # Once the bank has gone round, reshuffle so the next cycle doesn't regroup
+        # the same questions in the same order as the last one
+        since_shuffle += count
+        if since_shuffle >= bank_size:
+            order = list(queue)
+            rng.shuffle(order)
+            queue = deque(order)
+            since_shuffle = 0
+    return selections
+
+
+def verify_variants(bank_size, selections):
+    # Independent check of the constraints: (questions used, max shared by any two variants)
+    used_in = [[] for _ in range(bank_size)]
+    for v, picked in enumerate(selections):
+        for q in picked:
+            used_in[q].append(v)
+
+    worst = 0
+    for v, picked in enumerate(selections):
+        shared = Counter(w for q in picked for w in used_in[q] if w > v)
+        if shared:
+            worst = max(worst, max(shared.values()))
+    covered = sum(1 for variants in used_in if variants)
+    return covered, worst
+
+
+def make_variant(index, picked, seed):
+    # Question and option order are seeded per variant, so a variant can be rebuilt from its number
+    rng = random.Random(f"{seed}-{index}")
+    picked = [_bank[q] for q in picked]
+    rng.shuffle(picked)
+    variant = []
+    for q in picked:
+        options = q["options"][:]
+        rng.shuffle(options)
+        variant.append({"id": q["id"], "question": q["question"], "options": options, "answer": q["answer"]})
+    return variant
+
+
+def _answer_label(q):
+    # A few bank answers (e.g. "All are valid") are not among the listed options
+    if q["answer"] in q["options"]:
+        return f"{'ABCDEFGH'[q['options'].index(q['answer'])]}. {q['answer']}"
+    return q["answer"]
+
+
+def render_markdown(number, variant):
+    exam = [f"# Exam Variant {number}", ""]
+    key = [f"# Answer Key: Variant {number}", ""]
+    for i, q in enumerate(variant, 1):
+        exam.append(f"### Q{i}: {q['question']}")
+        for letter, opt in zip("ABCDEFGH", q["options"]):
+            exam.append(f"- {letter}. {opt}")
+        exam.append("")
+        key.append(f"{i}. {_answer_label(q)}")
+    return "\n".join(exam) + "\n", "\n".join(key) + "\n"
+
+
+def render_html(number, variant):
+    exam = [f"<h1>Exam Variant {number}</h1>"]
+    key = [f"<h1>Answer Key: Variant {number}</h1>", "<ol>"]
+    for i, q in enumerate(variant, 1):
+        exam.append(f"<h3>Q{i}: {html.escape(q['question'])}</h3>")
+        exam.append('<ol type="A">')
+        for opt in q["options"]:
+            exam.append(f"<li>{html.escape(opt)}</li>")
+        exam.append("</ol>")
+        key.append(f"<li>{html.escape(_answer_label(q))}</li>")
+    key.append("</ol>")
+    return "\n".join(exam) + "\n", "\n".join(key) + "\n"
+
+
+def _build(job):
+    index, picked, seed, fmt = job
+    variant = make_variant(index, picked, seed)
+    if fmt == "html":
+        exam, key = render_html(index + 1, variant)
+    else:
+        exam, key = render_markdown(index + 1, variant)
+    return index, exam, key
+
+
+def peak_memory_mb():
+    # ru_maxrss is in KiB on Linux; children covers the pool workers
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own / 1024, children / 1024
+
+
+def generate(bank, variants, count, max_overlap, seed, out_dir, fmt="md", workers=None):
+    if count > len(bank):
+        raise ValueError(f"Cannot put {count} questions in a variant, the bank only has {len(bank)}")
+
+    start = time.perf_counter()
+    selections = select_variants(len(bank), variants, count, max_overlap, seed)
+    covered, worst = verify_variants(len(bank), selections)
+    if worst > max_overlap:
+        raise ValueError(f"Two variants share {worst} questions, more than --max-overlap {max_overlap}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    ext = "html" if fmt == "html" else "md"
+    jobs = ((i, picked, seed, fmt) for i, picked in enumerate(selections))
+
+    with Pool(workers, initializer=_init_worker, initargs=(bank,)) as pool:
+        # Variants are written as soon as a worker finishes them, nothing rendered is kept in memory
+        for index, exam, key in pool.imap_unordered(_build, jobs, chunksize=64):
+            with open(os.path.join(out_dir, f"variant_{index + 1:05d}.{ext}"), "w") as f:
+                f.write(exam)
+            with open(os.path.join(out_dir, f"variant_{index + 1:05d}_key.{ext}"), "w") as f:
+                f.write(key)
+    return time.perf_counter() - start, covered, worst
+
+
+def synthetic_bank(size, seed=0):
+    # Stand-in bank for benchmarking at sizes well beyond mid.json + end.json
+    rng = random.Random(seed)
+    bank = []
+    for i in range(size):
+        options = [f"Option {i}-{j}" for j in range(4)]
+        bank.append({"id": i, "question": f"Synthetic question {i}?", "options": options, "answer": rng.choice(options)})
+    return bank
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate seeded printable exam variants with answer keys")
+    parser.add_argument("--source", choices=["Midterm", "Final", "Both"], default="Both")
+    parser.add_argument("--bank", help="JSON question file to use instead of --source")
+    parser.add_argument("--synthetic", type=int, help="use a generated bank of this many questions")
+    parser.add_argument("--variants", type=int, default=100)
+    parser.add_argument("--questions", type=int, default=20, help="questions per variant")
+    parser.add_argument("--max-overlap", type=int, default=None,
+                        help="most questions any two variants may share (default: half of --questions)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["md", "html"], default="md")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="exams")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="write into a non-empty --out, removing the variant files of an earlier run first")
+    args = parser.parse_args(argv)
+
+    # A rerun with fewer variants would otherwise leave old variant files next to the
+    # new ones, and a printed batch could mix two runs
+    if os.path.isdir(args.out) and os.listdir(args.out):
+        if not args.overwrite:
+            parser.error(f"{args.out} is not empty; pass --overwrite to replace its variant files")
+        for name in os.listdir(args.out):
+            if name.startswith("variant_"):
+                os.remove(os.path.join(args.out, name))
+
+    if args.synthetic:
+        bank = synthetic_bank(args.synthetic, args.seed)
+    elif args.bank:
+        with open(args.bank) as f:
+            bank = json.load(f)
+    else:
+        bank = load_questions(args.source)
+
+    max_overlap = args.questions // 2 if args.max_overlap is None else args.max_overlap
+    try:
+        elapsed, covered, worst = generate(bank, args.variants, args.questions, max_overlap, args.seed,
+                                           args.out, args.format, args.workers)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    own, children = peak_memory_mb()
+    print(f"Generated {args.variants} variants from {len(bank)} questions in {elapsed:.2f}s")
+    print(f"Coverage: {covered} of {len(bank)} questions used ({covered / len(bank):.1%})")
+    print(f"Max questions shared by two variants: {worst} (limit {max_overlap})")
+    print(f"Variants per second: {args.variants / elapsed:.1f}")
+    print(f"Peak memory: main {own:.1f} MB, largest worker {children:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
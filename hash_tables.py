@@ -0,0 +1,420 @@
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+
+# Hash table lab: separate chaining, linear probing, quadratic probing and Robin Hood
+# hashing over plain Python lists, with probe counting so collisions can be measured.
+
+_EMPTY = object()
+_DELETED = object()
+
+
+# ----------------- Hash functions -----------------
+
+def builtin_hash(key):
+    return hash(key)
+
+
+def fibonacci_hash(key):
+    # Multiplicative (Knuth) hashing: spreads sequential integers over the whole table
+    return ((hash(key) * 11400714819323198485) & 0xFFFFFFFFFFFFFFFF) >> 32
+
+
+def poor_hash(key):
+    # Deliberately bad: only 64 distinct values, so everything piles into a few slots
+    return hash(key) % 64
+
+
+HASH_FUNCTIONS = {
+    "builtin": builtin_hash,
+    "fibonacci": fibonacci_hash,
+    "poor": poor_hash,
+}
+
+
+def _capacity_for(n):
+    # Open addressing tables use power-of-two sizes so a bit mask replaces the modulo
+    # (and quadratic probing with triangular steps visits every slot)
+    cap = 8
+    while cap < n:
+        cap *= 2
+    return cap
+
+
+# ----------------- Separate chaining -----------------
+
+class ChainingHashTable:
+    def __init__(self, capacity=8, hash_func=builtin_hash, max_load=1.0, growth=2):
+        self.hash_func = hash_func
+        self.max_load = max_load  # None disables resizing
+        self.growth = growth
+        self.buckets = [[] for _ in range(capacity)]
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _bucket(self, key):
+        return self.buckets[self.hash_func(key) % len(self.buckets)]
+
+    def put(self, key, value):
+        bucket = self._bucket(key)
+        for entry in bucket:
+            if entry[0] == key:
+                entry[1] = value
+                return
+        bucket.append([key, value])
+        self.size += 1
+        if self.max_load is not None and self.size > self.max_load * len(self.buckets):
+            self._resize(int(len(self.buckets) * self.growth))
+
+    def get(self, key, default=None):
+        for entry in self._bucket(key):
+            if entry[0] == key:
+                return entry[1]
+        return default
+
+    def remove(self, key):
+        bucket = self._bucket(key)
+        for i, entry in enumerate(bucket):
+            if entry[0] == key:
+                bucket.pop(i)
+                self.size -= 1
+                return True
+        return False
+
+    def probe_count(self, key):
+        # Entries compared before the key is found (or the chain runs out)
+        probes = 0
+        for entry in self._bucket(key):
+            probes += 1
+            if entry[0] == key:
+                break
+        return probes
+
+    def _resize(self, capacity):
+        old = self.buckets
+        self.buckets = [[] for _ in range(capacity)]
+        for bucket in old:
+            for key, value in bucket:
+                self._bucket(key).append([key, value])
+
+    def memory_bytes(self):
+        return sys.getsizeof(self.buckets) + sum(
+            sys.getsizeof(b) + sum(sys.getsizeof(e) for e in b) for b in self.buckets
+        )
+
+
+# ----------------- Open addressing -----------------
+
+class LinearProbingHashTable:
+    def __init__(self, capacity=8, hash_func=builtin_hash, max_load=0.7, growth=2):
+        self.hash_func = hash_func
+        self.max_load = max_load
+        self.growth = growth
+        self._alloc(_capacity_for(capacity))
+
+    def _alloc(self, capacity):
+        self.keys = [_EMPTY] * capacity
+        self.values = [None] * capacity
+        self.mask = capacity - 1
+        self.size = 0
+        self.used = 0  # live keys + tombstones, what actually slows probing down
+
+    def __len__(self):
+        return self.size
+
+    def _step(self, i):
+        return i
+
+    def _slots(self, key):
+        home = self.hash_func(key) & self.mask
+        for i in range(self.mask + 1):
+            yield (home + self._step(i)) & self.mask
+
+    def _find(self, key):
+        # Returns (slot, probes); slot is None when the key is absent
+        probes = 0
+        for slot in self._slots(key):
+            probes += 1
+            k = self.keys[slot]
+            if k is _EMPTY:
+                return None, probes
+            if k is not _DELETED and k == key:
+                return slot, probes
+        return None, probes
+
+    def put(self, key, value):
+        first_free = None
+        for slot in self._slots(key):
+            k = self.keys[slot]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if first_free is None:
+                    first_free = slot
+            elif k == key:
+                self.values[slot] = value
+                return
+        else:
+            if first_free is None:
+                raise OverflowError("hash table is full")
+
+        if first_free is not None:
+            slot = first_free
+        else:
+            self.used += 1
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.size += 1
+        if self.max_load is not None and self.used > self.max_load * (self.mask + 1):
+            self._resize(int((self.mask + 1) * self.growth))
+
+    def get(self, key, default=None):
+        slot, _ = self._find(key)
+        return default if slot is None else self.values[slot]
+
+    def remove(self, key):
+        slot, _ = self._find(key)
+        if slot is None:
+            return False
+        self.keys[slot] = _DELETED
+        self.values[slot] = None
+        self.size -= 1
+        return True
+
+    def probe_count(self, key):
+        return self._find(key)[1]
+
+    def _resize(self, capacity):
+        keys, values = self.keys, self.values
+        self._alloc(_capacity_for(capacity))
+        for k, v in zip(keys, values):
+            if k is not _EMPTY and k is not _DELETED:
+                self.put(k, v)
+
+    def memory_bytes(self):
+        return sys.getsizeof(self.keys) + sys.getsizeof(self.values)
+
+
+class QuadraticProbingHashTable(LinearProbingHashTable):
+    def _step(self, i):
+        # Triangular numbers 0, 1, 3, 6, ... hit every slot of a power-of-two table
+        return i * (i + 1) // 2
+
+
+class RobinHoodHashTable:
+    def __init__(self, capacity=8, hash_func=builtin_hash, max_load=0.9, growth=2):
+        self.hash_func = hash_func
+        self.max_load = max_load
+        self.growth = growth
+        self._alloc(_capacity_for(capacity))
+
+    def _alloc(self, capacity):
+        self.keys = [_EMPTY] * capacity
+        self.values = [None] * capacity
+        self.dist = [0] * capacity  # how far each key sits from its home slot
+        self.mask = capacity - 1
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _find(self, key):
+        slot = self.hash_func(key) & self.mask
+        d = 0
+        while True:
+            k = self.keys[slot]
+            # A resident closer to home than we are means our key would have displaced it
+            if k is _EMPTY or self.dist[slot] < d:
+                return None, d + 1
+            if k == key:
+                return slot, d + 1
+            slot = (slot + 1) & self.mask
+            d += 1
+
+    def put(self, key, value):
+        slot, _ = self._find(key)
+        if slot is not None:
+            self.values[slot] = value
+            return
+        if self.size + 1 > self.mask + 1:
+            raise OverflowError("hash table is full")
+
+        slot = self.hash_func(key) & self.mask
+        d = 0
+        while True:
+            if self.keys[slot] is _EMPTY:
+                self.keys[slot], self.values[slot], self.dist[slot] = key, value, d
+                break
+            # Take from the rich: swap with any resident that is closer to its home
+            if self.dist[slot] < d:
+                key, self.keys[slot] = self.keys[slot], key
+                value, self.values[slot] = self.values[slot], value
+                d, self.dist[slot] = self.dist[slot], d
+            slot = (slot + 1) & self.mask
+            d += 1
+
+        self.size += 1
+        if self.max_load is not None and self.size > self.max_load * (self.mask + 1):
+            self._resize(int((self.mask + 1) * self.growth))
+
+    def get(self, key, default=None):
+        slot, _ = self._find(key)
+        return default if slot is None else self.values[slot]
+
+    def remove(self, key):
+        slot, _ = self._find(key)
+        if slot is None:
+            return False
+        # Backward-shift deletion: no tombstones, later keys move one step closer to home
+        nxt = (slot + 1) & self.mask
+        while self.keys[nxt] is not _EMPTY and self.dist[nxt] > 0:
+            self.keys[slot], self.values[slot], self.dist[slot] = self.keys[nxt], self.values[nxt], self.dist[nxt] - 1
+            slot, nxt = nxt, (nxt + 1) & self.mask
+        self.keys[slot], self.values[slot], self.dist[slot] = _EMPTY, None, 0
+        self.size -= 1
+        return True
+
+    def probe_count(self, key):
+        return self._find(key)[1]
+
+    def _resize(self, capacity):
+        keys, values = self.keys, self.values
+        self._alloc(_capacity_for(capacity))
+        for k, v in zip(keys, values):
+            if k is not _EMPTY:
+                self.put(k, v)
+
+    def memory_bytes(self):
+        return sys.getsizeof(self.keys) + sys.getsizeof(self.values) + sys.getsizeof(self.dist)
+
+
+TABLES = {
+    "chaining": ChainingHashTable,
+    "linear": LinearProbingHashTable,
+    "quadratic": QuadraticProbingHashTable,
+    "robinhood": RobinHoodHashTable,
+}
+
+
+# ----------------- Benchmarks -----------------
+
+def probe_stats(table, keys):
+    counts = sorted(table.probe_count(k) for k in keys)
+    return {
+        "mean": sum(counts) / len(counts),
+        "p99": counts[min(len(counts) - 1, int(len(counts) * 0.99))],
+        "max": counts[-1],
+        # probe length -> number of keys, the full distribution for the CDF chart
+        "histogram": Counter(counts),
+    }
+
+
+def run_benchmark(capacity, load_factor, kind, hash_name="builtin", seed=0):
+    # Fill a fixed-size table (no resizing) to exactly `load_factor`, then look every key up
+    n = int(capacity * load_factor)
+    keys = random.Random(seed).sample(range(capacity * 16), n)
+
+    if kind == "dict":
+        table = {}
+        start = time.perf_counter()
+        for k in keys:
+            table[k] = k
+        insert_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for k in keys:
+            table[k]
+        lookup_time = time.perf_counter() - start
+        return {"n": n, "insert_per_s": n / insert_time, "lookup_per_s": n / lookup_time,
+                "memory_mb": sys.getsizeof(table) / 2**20, "probes": None}
+
+    table = TABLES[kind](capacity, HASH_FUNCTIONS[hash_name], max_load=None)
+    start = time.perf_counter()
+    for k in keys:
+        table.put(k, k)
+    insert_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for k in keys:
+        table.get(k)
+    lookup_time = time.perf_counter() - start
+    return {"n": n, "insert_per_s": n / insert_time, "lookup_per_s": n / lookup_time,
+            "memory_mb": table.memory_bytes() / 2**20, "probes": probe_stats(table, keys)}
+
+
+def plot(results, load_factors, path):
+    # matplotlib is only needed for the chart, so it is imported here
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # Top row: summary against load factor. Bottom row: one probe-length CDF per load
+    # factor, where a steep curve means low variance (Robin Hood) and a long tail
+    # means unlucky keys (linear probing).
+    # Each row is its own subfigure with its own grid, so they lay out independently
+    cols = max(3, len(load_factors))
+    fig = plt.figure(figsize=(5 * cols, 9), layout="constrained")
+    top, bottom = fig.subfigures(2, 1)
+    axes = top.subplots(1, 3)
+    for kind, rows in results.items():
+        axes[1].plot(load_factors, [r["lookup_per_s"] for r in rows], marker="o", label=kind)
+        axes[2].plot(load_factors, [r["memory_mb"] for r in rows], marker="o", label=kind)
+        if rows[0]["probes"] is not None:
+            axes[0].plot(load_factors, [r["probes"]["mean"] for r in rows], marker="o", label=kind)
+    axes[0].set_title("Mean probes per successful lookup")
+    axes[1].set_title("Lookups per second")
+    axes[2].set_title("Table memory (MB)")
+    for ax in axes:
+        ax.set_xlabel("Load factor")
+        ax.legend()
+
+    for i, (lf, ax) in enumerate(zip(load_factors, bottom.subplots(1, len(load_factors), squeeze=False)[0])):
+        for kind, rows in results.items():
+            probes = rows[i]["probes"]
+            if probes is None:
+                continue
+            lengths = sorted(probes["histogram"])
+            total = sum(probes["histogram"].values())
+            seen, cdf = 0, []
+            for length in lengths:
+                seen += probes["histogram"][length]
+                cdf.append(seen / total)
+            ax.step(lengths, cdf, where="post", label=kind)
+        ax.set_xscale("log")
+        ax.set_title(f"Probe length CDF, load {lf:.2f}")
+        ax.set_xlabel("Probes")
+        ax.set_ylabel("Fraction of keys")
+        ax.legend()
+    fig.savefig(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Open addressing vs. chaining load-factor benchmark")
+    parser.add_argument("--keys", type=int, default=10**6, help="table capacity (keys at load factor 1.0)")
+    parser.add_argument("--load-factors", type=float, nargs="+", default=[0.25, 0.5, 0.7, 0.8, 0.9])
+    parser.add_argument("--tables", nargs="+", default=[*TABLES, "dict"], choices=[*TABLES, "dict"])
+    parser.add_argument("--hash", choices=list(HASH_FUNCTIONS), default="builtin")
+    parser.add_argument("--chart", help="save a PNG chart to this path (needs matplotlib)")
+    args = parser.parse_args(argv)
+
+    capacity = _capacity_for(args.keys)
+    results = {}
+    for kind in args.tables:
+        results[kind] = []
+        for lf in args.load_factors:
+            r = run_benchmark(capacity, lf, kind, args.hash)
+            results[kind].append(r)
+            probes = "-" if r["probes"] is None else \
+                f"mean {r['probes']['mean']:.2f} p99 {r['probes']['p99']} max {r['probes']['max']}"
+            print(f"{kind:10} load {lf:.2f}  n={r['n']:>9}  insert {r['insert_per_s']:>11,.0f}/s  "
+                  f"lookup {r['lookup_per_s']:>11,.0f}/s  mem {r['memory_mb']:7.1f} MB  probes {probes}")
+
+    if args.chart:
+        plot(results, args.load_factors, args.chart)
+        print(f"Chart saved to {args.chart}")
+
+
+if __name__ == "__main__":
+    main()
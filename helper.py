@@ -52,6 +52,28 @@ def fib(n):
 """, language="python")
     st.markdown("""
     ➕ Use memoization or dynamic programming to improve this.
+    """)
+    if language == "Python":
+        st.code("""
+from functools import lru_cache
+
+# Top-down: O(n) time, O(n) cache + O(n) call stack
+@lru_cache(maxsize=None)
+def fib_memo(n):
+    if n <= 1:
+        return n
+    return fib_memo(n-1) + fib_memo(n-2)
+
+# Bottom-up with rolling variables: O(n) time, O(1) space
+def fib_rolling(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+""", language="python")
+    st.markdown("""
+    Same idea for 2D problems (LCS, knapsack, edit distance): keeping only the
+    previous row cuts the table from O(n·m) to O(m). Compare with `python dp.py`.
 
     ### 🧩 Recursive Data Types
     Examples:
@@ -332,6 +354,14 @@ HashMap<String, Integer> map = new HashMap<>();
 map.put("apple", 5);
 """, language="java")
     st.markdown("""
+    ### Collisions & Load Factor:
+    - Load factor α = keys / slots
+    - **Separate chaining**: each slot holds a list of entries
+    - **Open addressing**: linear probing, quadratic probing, Robin Hood hashing
+    - O(1) only holds while α stays low and the hash function spreads keys well;
+      a poorly designed hash function degrades lookups to O(n)
+    - `python hash_tables.py --chart out.png` compares them against `dict`
+
     ### Trees:
     - Hierarchical data structure
     - Each node has children nodes
@@ -460,6 +490,65 @@ void quickSort(int[] arr, int low, int high) {
     }
 }
 """, language="java")
+    show_sort_visualizer()
+
+def show_sort_visualizer():
+    # Imported here so the trace generators only load when the Sorting topic is opened
+    import random
+    import sort_trace
+
+    st.markdown("""
+    ### 🎞️ Step-by-step Visualizer
+    Each algorithm is a generator yielding one compare/swap/write per step,
+    so memory stays O(n) no matter how many steps the sort takes.
+    """)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        algo = st.selectbox("Algorithm", list(sort_trace.ALGORITHMS), key="viz_algo")
+    with col2:
+        n = st.number_input("Array size", min_value=2, max_value=100000, value=50, key="viz_n")
+    with col3:
+        k = st.number_input("Steps per click", min_value=1, max_value=10**7, value=10, key="viz_k")
+
+    # Start a fresh trace when the algorithm or size changes, or on request
+    if st.button("🔀 New Array") or st.session_state.get("viz_config") != (algo, n):
+        arr = list(range(1, n + 1))
+        random.shuffle(arr)
+        st.session_state.viz_config = (algo, n)
+        st.session_state.viz_arr = arr
+        st.session_state.viz_steps = sort_trace.ALGORITHMS[algo](arr)
+        st.session_state.viz_count = 0
+        st.session_state.viz_last = None
+
+    arr = st.session_state.viz_arr
+    steps = st.session_state.viz_steps
+    chart = st.empty()
+    status = st.empty()
+
+    def render(delta, taken=0):
+        chart.bar_chart(sort_trace.downsample(arr))
+        status.caption(f"Step {st.session_state.viz_count + taken}: {delta or 'not started'}")
+
+    col_skip, col_play = st.columns(2)
+    with col_skip:
+        skip = st.button(f"⏭️ Skip {k} Steps")
+    with col_play:
+        play = st.button(f"▶️ Play {k} Steps")
+
+    if skip:
+        # No frames in between, just jump
+        taken, last = sort_trace.skip(steps, k)
+    elif play:
+        taken, last = sort_trace.play(steps, k, render)
+    else:
+        taken, last = 0, None
+
+    st.session_state.viz_count += taken
+    if last is not None:
+        st.session_state.viz_last = last
+    render(st.session_state.viz_last)
+    if (skip or play) and taken < k:
+        st.success("✅ Sorted!")
 
 def show_searching(language):
     st.header("🔍 Topic 9: Searching Algorithms")
@@ -473,6 +562,16 @@ def show_searching(language):
     - Repeatedly divide search interval in half
     - O(log n) time
 
+    ### Interpolation Search:
+    - Guesses the position from the value (like looking up a word in a dictionary)
+    - O(log log n) on evenly spread data, O(n) worst case
+
+    ### Exponential Search:
+    - Doubles the bound (1, 2, 4, 8, ...) until it passes x, then binary searches
+    - O(log i) where i is the position of x
+
+    `python search_mmap.py --n 1000000000` runs all of them over a memory-mapped file
+
     ### Example: Binary Search Python
     """)
     if language == "Python":
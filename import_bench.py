@@ -0,0 +1,135 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# What the original Final.py (see baseline_script) imported at the top
+# vs. what Final.py imports before a topic is shown. helper.py only imports streamlit,
+# so the two differ by noise: the render speedup comes from building only the
+# selected section, not from deferring imports.
+EAGER = ["json", "random", "streamlit", "quiz_helper", "helper"]
+LAZY = ["random", "streamlit", "quiz_helper"]
+
+SCRIPT = "Final.py"
+
+
+def importtime(modules):
+    # Fresh interpreter with -X importtime; every line on stderr looks like
+    # "import time: self [us] | cumulative | imported package"
+    code = "".join(f"import {m}\n" for m in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return None, []
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    # Top-level imports are the ones without indentation in the name column
+    total = sum(cum for cum, _, name in rows if len(name) - len(name.lstrip()) == 1)
+    return total, rows
+
+
+def available(modules):
+    found = []
+    for m in modules:
+        ok = subprocess.run([sys.executable, "-c", f"import {m}"], cwd=HERE, capture_output=True).returncode == 0
+        if ok:
+            found.append(m)
+        else:
+            print(f"  (skipping {m}: not installed)")
+    return found
+
+
+def baseline_script(rev):
+    # Final.py as of `rev` (default: the repository's first commit), written next to
+    # the current one so it imports the same helper.py and reads the same JSON files.
+    # Returns the temporary file's path, or None if git cannot provide it.
+    if rev is None:
+        roots = subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"],
+                               cwd=HERE, capture_output=True, text=True)
+        if roots.returncode != 0:
+            return None
+        rev = roots.stdout.split()[-1]
+    result = subprocess.run(["git", "show", f"{rev}:Final.py"], cwd=HERE, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    with tempfile.NamedTemporaryFile("w", suffix=".py", prefix="_baseline_", dir=HERE, delete=False) as f:
+        f.write(result.stdout)
+    return f.name
+
+
+def first_render(script, runs):
+    # First run of `script` in a fresh worker, using Streamlit's headless AppTest.
+    # Only the script run is timed: importing streamlit itself costs the same either way.
+    code = (
+        "import time\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"at = AppTest.from_file({script!r}, default_timeout=60)\n"
+        "start = time.perf_counter()\n"
+        "at.run()\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return sorted(times)[len(times) // 2]
+
+
+def report(label, modules, top):
+    modules = available(modules)
+    total, rows = importtime(modules)
+    if total is None:
+        print(f"{label}: import failed")
+        return
+    print(f"{label}: {total / 1000:.1f} ms cumulative ({', '.join(modules)})")
+    for cum, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cum / 1000:8.1f} ms  {self_us / 1000:8.1f} ms self  {name.strip()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time report for the Streamlit entry point")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--runs", type=int, default=3, help="fresh-worker runs for time-to-first-render")
+    parser.add_argument("--baseline-rev", default=None,
+                        help="git revision whose Final.py is the baseline (default: first commit)")
+    args = parser.parse_args(argv)
+
+    report("Eager imports", EAGER, args.top)
+    print()
+    report("Lazy imports", LAZY, args.top)
+    print()
+
+    baseline = baseline_script(args.baseline_rev)
+    if baseline is None:
+        print("Time-to-first-render: skipped (baseline Final.py not found in git)")
+        return
+    try:
+        start = time.perf_counter()
+        before = first_render(baseline, args.runs)
+        after = first_render(SCRIPT, args.runs)
+    finally:
+        os.remove(baseline)
+    if before is None or after is None:
+        print("Time-to-first-render: skipped (streamlit AppTest not available)")
+    else:
+        print(f"Time-to-first-render (median of {args.runs} fresh workers each)"
+              f" [{time.perf_counter() - start:.1f}s total]:")
+        print(f"  Baseline Final.py: {before * 1000:7.0f} ms")
+        print(f"  Current Final.py:  {after * 1000:7.0f} ms ({(before - after) / before:.0%} faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+import argparse
+import mmap
+import os
+import random
+import time
+from array import array
+from bisect import bisect_left
+
+# Searching over a sorted binary file of fixed-width (8-byte, native order) integers.
+# The file is memory-mapped and viewed through memoryview.cast("q"), so the OS only
+# pages in what a search actually touches and the file can be larger than RAM.
+
+ITEM_SIZE = 8
+PAGE_SIZE = mmap.PAGESIZE
+
+
+def write_sorted_file(path, n, step=2, chunk=1 << 20):
+    # Values 0, step, 2*step, ... written in chunks, never all in memory.
+    # With step=2 every odd query is a guaranteed miss.
+    with open(path, "wb") as f:
+        for start in range(0, n, chunk):
+            array("q", range(start * step, min(start + chunk, n) * step, step)).tofile(f)
+
+
+class SortedIntFile:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mm).cast("q")
+
+    def __len__(self):
+        return len(self.view)
+
+    def close(self):
+        self.view.release()
+        self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PageCounter:
+    # Wraps a sequence and records which pages of the file each lookup lands on
+    def __init__(self, seq):
+        self.seq = seq
+        self.pages = set()
+
+    def __len__(self):
+        return len(self.seq)
+
+    def __getitem__(self, i):
+        self.pages.add(i * ITEM_SIZE // PAGE_SIZE)
+        return self.seq[i]
+
+
+# ----------------- Search algorithms -----------------
+# All of them work on any sorted sequence (list, memoryview, PageCounter)
+# and return the index of x, or -1 if it is not there.
+
+def linear_search(arr, x):
+    for i in range(len(arr)):
+        if arr[i] == x:
+            return i
+        if arr[i] > x:
+            break
+    return -1
+
+
+def binary_search(arr, x, left=0, right=None):
+    if right is None:
+        right = len(arr) - 1
+    while left <= right:
+        mid = (left + right) // 2
+        if arr[mid] == x:
+            return mid
+        elif arr[mid] < x:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1
+
+
+def bisect_search(arr, x):
+    i = bisect_left(arr, x)
+    return i if i < len(arr) and arr[i] == x else -1
+
+
+def interpolation_search(arr, x):
+    # Guesses the position from the value; O(log log n) probes on evenly spread data
+    left, right = 0, len(arr) - 1
+    while left <= right:
+        lo, hi = arr[left], arr[right]
+        if x < lo or x > hi:
+            return -1
+        if lo == hi:
+            return left if lo == x else -1
+        pos = left + (x - lo) * (right - left) // (hi - lo)
+        v = arr[pos]
+        if v == x:
+            return pos
+        elif v < x:
+            left = pos + 1
+        else:
+            right = pos - 1
+    return -1
+
+
+def _gallop(arr, x, start):
+    # First index >= start whose value is >= x, found by doubling then binary search
+    n = len(arr)
+    if start >= n or arr[start] >= x:
+        return start
+    bound = 1
+    while start + bound < n and arr[start + bound] < x:
+        bound *= 2
+    left, right = start + bound // 2 + 1, min(start + bound, n)
+    while left < right:
+        mid = (left + right) // 2
+        if arr[mid] < x:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def exponential_search(arr, x):
+    i = _gallop(arr, x, 0)
+    return i if i < len(arr) and arr[i] == x else -1
+
+
+def batch_search(arr, queries):
+    # Answers sorted queries in one forward pass: each search gallops on from where
+    # the previous one stopped, so nearby queries share the pages they touch
+    results = []
+    pos = 0
+    for x in queries:
+        pos = _gallop(arr, x, pos)
+        results.append(pos if pos < len(arr) and arr[pos] == x else -1)
+    return results
+
+
+SEARCHES = {
+    "linear": linear_search,
+    "bisect": bisect_search,
+    "binary": binary_search,
+    "interpolation": interpolation_search,
+    "exponential": exponential_search,
+}
+
+
+# ----------------- Benchmark -----------------
+
+def bench(data, name, queries):
+    search = SEARCHES[name]
+    start = time.perf_counter()
+    for x in queries:
+        search(data.view, x)
+    elapsed = time.perf_counter() - start
+
+    pages = 0
+    for x in queries:
+        counter = PageCounter(data.view)
+        search(counter, x)
+        pages += len(counter.pages)
+    return elapsed / len(queries), pages / len(queries)
+
+
+def bench_batch(data, queries):
+    queries = sorted(queries)
+    start = time.perf_counter()
+    batch_search(data.view, queries)
+    elapsed = time.perf_counter() - start
+
+    counter = PageCounter(data.view)
+    batch_search(counter, queries)
+    return elapsed / len(queries), len(counter.pages) / len(queries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search benchmarks over a memory-mapped sorted integer file")
+    parser.add_argument("--n", type=int, default=10**7, help="number of integers in the file (8 bytes each)")
+    parser.add_argument("--file", default="sorted_ints.bin")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--linear-queries", type=int, default=5,
+                        help="linear scan is O(n) per query, so it gets fewer queries")
+    parser.add_argument("--keep", action="store_true", help="keep the data file if this run generated it")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="regenerate --file even if it already exists (it is then removed afterwards)")
+    args = parser.parse_args(argv)
+
+    # An existing file is used as it is (it may be someone's own sorted data) and is
+    # never deleted; only a file this run wrote gets cleaned up
+    created = False
+    if os.path.exists(args.file) and not args.overwrite:
+        size = os.path.getsize(args.file)
+        if size == 0 or size % ITEM_SIZE:
+            parser.error(f"{args.file} is not a non-empty file of {ITEM_SIZE}-byte integers; "
+                         "pass --overwrite to replace it with generated data")
+        print(f"Using existing {args.file} ({os.path.getsize(args.file) // ITEM_SIZE:,} integers)")
+    else:
+        print(f"Writing {args.n:,} integers ({args.n * ITEM_SIZE / 2**30:.2f} GiB) to {args.file}...")
+        write_sorted_file(args.file, args.n)
+        created = True
+
+    with SortedIntFile(args.file) as data:
+        # Queries over the file's value range, so roughly half of them miss on generated data
+        rng = random.Random(0)
+        low, high = data.view[0], data.view[-1]
+        queries = [rng.randint(low, high + 1) for _ in range(args.queries)]
+
+        print(f"{'search':14} {'us/query':>12} {'pages/query':>12}")
+        for name in SEARCHES:
+            qs = queries[:args.linear_queries] if name == "linear" else queries
+            per_query, pages = bench(data, name, qs)
+            print(f"{name:14} {per_query * 1e6:12.1f} {pages:12.1f}")
+        per_query, pages = bench_batch(data, queries)
+        print(f"{'batch':14} {per_query * 1e6:12.1f} {pages:12.1f}")
+
+    if created and not args.keep:
+        os.remove(args.file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+import argparse
+import asyncio
+import gc
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+# Soak test for Final.py: hundreds of simulated students against a locally started
+# `streamlit run Final.py`. Every simulated student is a real browser session on the
+# server's websocket, speaking the same BackMsg/ForwardMsg protobufs as the frontend
+# (sending widget states, waiting for script_finished), so the server's RSS includes
+# its session manager, websocket and per-session state. All sessions run concurrently
+# in one asyncio loop. Switching sections is a rerun of its own: only the selected
+# section's widgets exist.
+#
+# --apptest is a fallback for when no server can be started: it drives in-process
+# AppTest sessions one at a time, measures this process instead of a server, and
+# includes AppTest's own element trees in the RSS.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def rss_mb(pid="self"):
+    # Current (not peak) resident memory, so released memory shows up
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+# ----------------- Server sessions -----------------
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, timeout=60):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "Final.py",
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("streamlit exited before it was ready")
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"streamlit did not answer on port {port} within {timeout}s")
+
+
+class ServerSession:
+    # One browser tab: a websocket plus the widget states the frontend would send back
+    def __init__(self, url, latencies):
+        self.url = url
+        self.latencies = latencies
+        self.ws = None
+        self.page_hash = ""
+        self.widgets = []   # (label, id, options, default index) of the last run's widgets
+        self.states = {}    # widget id -> WidgetState, resent on every rerun
+        self.triggers = []  # button clicks, sent once
+
+    async def connect(self):
+        import websockets
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        await self.ws.close()
+
+    def _widget(self, label):
+        return next(w for w in self.widgets if w[0] == label)
+
+    def value(self, label):
+        _, wid, options, default = self._widget(label)
+        state = self.states.get(wid)
+        return state.string_value if state is not None else options[default]
+
+    def options(self, label):
+        return self._widget(label)[2]
+
+    def _set_string(self, wid, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        self.states[wid] = WidgetState(id=wid, string_value=value)
+
+    def choose(self, label, index):
+        _, wid, options, _ = self._widget(label)
+        self._set_string(wid, options[index])
+
+    def check(self, label, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        wid = self._widget(label)[1]
+        self.states[wid] = WidgetState(id=wid, bool_value=value)
+
+    def click(self, label):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        self.triggers.append(WidgetState(id=self._widget(label)[1], trigger_value=True))
+
+    def answer_quiz(self, rng):
+        for label, wid, options, _ in self.widgets:
+            if label == "Select an answer:":
+                self._set_string(wid, rng.choice(options))
+
+    async def run(self):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = self.page_hash
+        msg.rerun_script.widget_states.widgets.extend([*self.states.values(), *self.triggers])
+        self.triggers = []
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        widgets = []
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self.page_hash = fwd.new_session.page_script_hash
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                name = element.WhichOneof("type")
+                if name == "exception":
+                    raise RuntimeError(element.exception.message)
+                if name in ("radio", "selectbox", "checkbox", "button"):
+                    el = getattr(element, name)
+                    options = list(getattr(el, "options", []))
+                    widgets.append((el.label, el.id, options, getattr(el, "default", 0)))
+            elif kind == "script_finished":
+                break
+        self.latencies.append(time.perf_counter() - start)
+
+        # Like the frontend, forget the state of widgets that are no longer on the page
+        self.widgets = widgets
+        ids = {w[1] for w in widgets}
+        self.states = {wid: s for wid, s in self.states.items() if wid in ids}
+
+
+# ----------------- AppTest fallback -----------------
+
+class AppTestSession:
+    # Same interface as ServerSession, backed by an in-process AppTest
+    def __init__(self, latencies):
+        from streamlit.testing.v1 import AppTest
+        self.at = AppTest.from_file(os.path.join(HERE, "Final.py"), default_timeout=120)
+        self.latencies = latencies
+
+    async def connect(self):
+        pass
+
+    async def close(self):
+        self.at = None
+
+    def _widget(self, label):
+        at = self.at
+        widgets = [*at.radio, *at.selectbox, *at.checkbox, *at.button]
+        return next(w for w in widgets if w.label == label)
+
+    def value(self, label):
+        return self._widget(label).value
+
+    def options(self, label):
+        return self._widget(label).options
+
+    def choose(self, label, index):
+        widget = self._widget(label)
+        widget.set_value(widget.options[index])
+
+    def check(self, label, value):
+        self._widget(label).set_value(value)
+
+    def click(self, label):
+        self._widget(label).click()
+
+    def answer_quiz(self, rng):
+        for r in self.at.radio:
+            if r.key and r.key.startswith("q_"):
+                r.set_value(rng.choice(r.options))
+
+    async def run(self):
+        cwd = os.getcwd()
+        os.chdir(HERE)  # Final.py opens mid.json/end.json relative to the working directory
+        try:
+            start = time.perf_counter()
+            self.at.run()
+            self.latencies.append(time.perf_counter() - start)
+        finally:
+            os.chdir(cwd)
+        if self.at.exception:
+            raise RuntimeError(self.at.exception[0].message)
+
+
+# ----------------- Simulated students -----------------
+
+async def goto(s, page):
+    if s.value("Section") != page:
+        s.choose("Section", s.options("Section").index(page))
+        await s.run()
+
+
+async def browse_topic(s, rng):
+    await goto(s, "📚 Conspects")
+    s.choose("📘 Choose Topic", rng.randrange(len(s.options("📘 Choose Topic"))))
+    await s.run()
+
+
+async def page_past_quizzes(s, rng):
+    await goto(s, "📝 Past Quizzes")
+    s.choose("📂 Select Quiz", rng.randrange(2))
+    await s.run()
+    s.check("🔀 Shuffle Questions", rng.random() < 0.5)
+    await s.run()
+
+
+async def take_quiz(s, rng):
+    await goto(s, "🎮 Take a Quiz")
+    s.choose("📚 Question Source", rng.randrange(3))
+    await s.run()
+    s.choose("🔢 Number of Questions", rng.randrange(4))
+    await s.run()
+    s.answer_quiz(rng)
+    await s.run()
+    s.click("✅ Submit Quiz")
+    await s.run()
+    # Final.py only swaps Submit for "Try Again" on the rerun after submitting
+    await s.run()
+    s.click("🔄 Try Again")
+    await s.run()
+
+
+ACTIONS = [browse_topic, page_past_quizzes, take_quiz]
+
+
+async def student(s, rng, actions, think):
+    await s.connect()
+    await s.run()
+    for _ in range(actions):
+        await asyncio.sleep(rng.uniform(0, think))
+        await rng.choice(ACTIONS)(s, rng)
+
+
+async def _sample_peak(pid, peak, stop):
+    while not stop.is_set():
+        peak[0] = max(peak[0], rss_mb(pid))
+        await asyncio.sleep(0.2)
+
+
+async def soak(make_session, pid, sessions, actions, think, settle, seed=0):
+    rng = random.Random(seed)
+    latencies = []
+    gc.collect()
+    baseline = rss_mb(pid)
+
+    open_sessions = [make_session(latencies) for _ in range(sessions)]
+    peak, stop = [baseline], asyncio.Event()
+    sampler = asyncio.create_task(_sample_peak(pid, peak, stop))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        student(s, random.Random(rng.random()), actions, think) for s in open_sessions
+    ))
+    elapsed = time.perf_counter() - start
+    open_rss = rss_mb(pid)
+    stop.set()
+    await sampler
+
+    # Close every session and see what the server gives back
+    for s in open_sessions:
+        await s.close()
+    open_sessions.clear()
+    gc.collect()
+    await asyncio.sleep(settle)
+    after = rss_mb(pid)
+
+    return {
+        "sessions": sessions,
+        "elapsed": elapsed,
+        "reruns": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "baseline_mb": baseline,
+        "open_mb": open_rss,
+        "peak_mb": peak[0],
+        "per_session_mb": (open_rss - baseline) / sessions,
+        "retained_mb": after - baseline,
+    }
+
+
+async def run_rounds(args, make_session, pid, label):
+    # One throwaway session first, so one-off costs (script compile, caches) are not
+    # counted as memory held by the sessions under test
+    warmup = make_session([])
+    await student(warmup, random.Random(args.seed), 1, 0)
+    await warmup.close()
+
+    print(label)
+    for rnd in range(1, args.rounds + 1):
+        r = await soak(make_session, pid, args.sessions, args.actions, args.think, args.settle, args.seed + rnd)
+        print(f"Round {rnd}: {r['sessions']} sessions, {r['reruns']} reruns in {r['elapsed']:.1f}s")
+        print(f"  Throughput: {r['throughput']:.1f} reruns/s")
+        print(f"  Rerun latency: p50 {r['p50'] * 1000:.0f} ms, p95 {r['p95'] * 1000:.0f} ms, p99 {r['p99'] * 1000:.0f} ms")
+        print(f"  RSS: {r['baseline_mb']:.1f} MB -> {r['open_mb']:.1f} MB with all sessions open"
+              f" ({r['per_session_mb']:.2f} MB/session, peak {r['peak_mb']:.1f} MB)")
+        print(f"  Not released {args.settle:.0f}s after closing sessions: {r['retained_mb']:.1f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-session soak test for the Streamlit app")
+    parser.add_argument("--sessions", type=int, default=200, help="sessions open at the same time")
+    parser.add_argument("--actions", type=int, default=10, help="interactions per session")
+    parser.add_argument("--think", type=float, default=1.0, help="max seconds a student waits between interactions")
+    parser.add_argument("--settle", type=float, default=5.0, help="seconds to wait after closing before measuring")
+    parser.add_argument("--rounds", type=int, default=1, help="repeat to see if retained memory keeps growing")
+    parser.add_argument("--port", type=int, default=None, help="default: any free port")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--apptest", action="store_true",
+                        help="fallback: in-process AppTest sessions, one at a time, no server")
+    args = parser.parse_args(argv)
+
+    if args.apptest:
+        label = "AppTest fallback (in-process, sequential, no server; RSS is this process)"
+        asyncio.run(run_rounds(args, AppTestSession, "self", label))
+        return
+
+    port = args.port or _free_port()
+    server = start_server(port)
+    try:
+        url = f"ws://localhost:{port}/_stcore/stream"
+        label = f"streamlit run Final.py on port {port} (server PID {server.pid})"
+        asyncio.run(run_rounds(args, lambda latencies: ServerSession(url, latencies), server.pid, label))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import time
+from collections import deque
+from itertools import islice
+
+# Sorting algorithms as generators. Each one sorts the list it is given in place and
+# yields a small delta per step instead of a full copy of the array, so a trace of
+# any length only ever needs the array itself: O(n) memory.
+#
+#   ("compare", i, j)        - arr[i] and arr[j] were compared
+#   ("swap", i, j)           - arr[i] and arr[j] were swapped
+#   ("write", i, v)          - arr[i] was set to v (merge sort copying back from its buffer)
+#   ("compare_runs", i, j)   - merge sort compared the elements that were at positions
+#                              i and j when the two runs were copied to its buffer;
+#                              arr[i] may already have been overwritten by then
+
+
+def bubble_sort_steps(arr):
+    n = len(arr)
+    for end in range(n - 1, 0, -1):
+        swapped = False
+        for i in range(end):
+            yield ("compare", i, i + 1)
+            if arr[i] > arr[i + 1]:
+                arr[i], arr[i + 1] = arr[i + 1], arr[i]
+                swapped = True
+                yield ("swap", i, i + 1)
+        if not swapped:
+            break
+
+
+def merge_sort_steps(arr):
+    # Bottom-up merge sort with one shared buffer, no recursion and no per-level copies
+    n = len(arr)
+    buf = [None] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid >= hi:
+                continue
+            buf[lo:hi] = arr[lo:hi]
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                yield ("compare_runs", i, j)
+                if buf[i] <= buf[j]:
+                    arr[k] = buf[i]
+                    i += 1
+                else:
+                    arr[k] = buf[j]
+                    j += 1
+                yield ("write", k, arr[k])
+                k += 1
+            for src in range(i, mid):
+                arr[k] = buf[src]
+                yield ("write", k, arr[k])
+                k += 1
+            for src in range(j, hi):
+                arr[k] = buf[src]
+                yield ("write", k, arr[k])
+                k += 1
+        width *= 2
+
+
+def quick_sort_steps(arr):
+    # Lomuto partition with an explicit stack; pushing the larger half first keeps
+    # the stack at O(log n) even on already sorted input
+    stack = [(0, len(arr) - 1)]
+    while stack:
+        low, high = stack.pop()
+        if low >= high:
+            continue
+        mid = (low + high) // 2
+        if mid != high:
+            arr[mid], arr[high] = arr[high], arr[mid]
+            yield ("swap", mid, high)
+        pivot = arr[high]
+        i = low
+        for j in range(low, high):
+            yield ("compare", j, high)
+            if arr[j] < pivot:
+                if i != j:
+                    arr[i], arr[j] = arr[j], arr[i]
+                    yield ("swap", i, j)
+                i += 1
+        if i != high:
+            arr[i], arr[high] = arr[high], arr[i]
+            yield ("swap", i, high)
+        if i - low > high - i:
+            stack.append((low, i - 1))
+            stack.append((i + 1, high))
+        else:
+            stack.append((i + 1, high))
+            stack.append((low, i - 1))
+
+
+ALGORITHMS = {
+    "Bubble Sort": bubble_sort_steps,
+    "Merge Sort": merge_sort_steps,
+    "Quick Sort": quick_sort_steps,
+}
+
+
+def skip(steps, k):
+    # Advance k steps without rendering anything; returns (steps taken, last delta)
+    window = deque(enumerate(islice(steps, k), 1), maxlen=1)
+    return window[0] if window else (0, None)
+
+
+def play(steps, k, render, fps=20):
+    # Advance k steps, calling render(delta, steps_so_far) at most `fps` times per second.
+    # The final step is always rendered so the view never lags behind the array.
+    interval = 1 / fps
+    next_frame = 0.0
+    taken, last = 0, None
+    for last in islice(steps, k):
+        taken += 1
+        now = time.perf_counter()
+        if now >= next_frame:
+            render(last, taken)
+            next_frame = now + interval
+    if last is not None:
+        render(last, taken)
+    return taken, last
+
+
+def downsample(arr, width=200):
+    # At most `width` bars for the chart, whatever n is
+    step = max(1, len(arr) // width)
+    return arr[::step]
@@ -0,0 +1,40 @@
+import os
+
+from streamlit.testing.v1 import AppTest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _widget(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def _goto(at, page):
+    _widget(at.radio, "Section").set_value(page)
+    at.run()
+
+
+def test_quiz_survives_section_switch(monkeypatch):
+    # Final.py opens mid.json/end.json relative to the working directory
+    monkeypatch.chdir(HERE)
+    at = AppTest.from_file("Final.py", default_timeout=60).run()
+    _goto(at, "🎮 Take a Quiz")
+    _widget(at.selectbox, "📚 Question Source").set_value("Both")
+    at.run()
+    _widget(at.selectbox, "🔢 Number of Questions").set_value(15)
+    at.run()
+    first = next(r for r in at.radio if r.key == "q_0")
+    first.set_value(first.options[-1])
+    at.run()
+    quiz = list(at.session_state["quiz"])
+    answers = list(at.session_state["quiz_answers"])
+
+    _goto(at, "📚 Conspects")
+    _goto(at, "🎮 Take a Quiz")
+
+    assert not at.exception
+    assert _widget(at.selectbox, "📚 Question Source").value == "Both"
+    assert _widget(at.selectbox, "🔢 Number of Questions").value == 15
+    assert list(at.session_state["quiz"]) == quiz
+    assert list(at.session_state["quiz_answers"]) == answers
+    assert next(r for r in at.radio if r.key == "q_0").value == answers[0]